@@ -1,31 +1,106 @@
-from abc import ABC, abstractmethod
+from array import array
+from dataclasses import dataclass, field
+import functools
 import json
 import math
 import logging
+import os
+import weakref
 
-# Configure logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+# Module logger; stays silent until the application configures logging
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
 
+# Geometry constants, hoisted so the methods skip the math.pi lookup
+_TAU = 2.0 * math.pi
+_PI = math.pi
 
-# Abstract Base Class
-class Tire(ABC):
+# Shared JSON encoder; payloads are flat, so the circular-reference check is skipped
+_ENCODER = json.JSONEncoder(check_circular=False)
+
+# Method tracing is opt-in through the TIRE_TRACE environment variable
+TRACE_ENABLED = os.getenv('TIRE_TRACE', '').lower() not in ('', '0', 'false', 'no')
+
+
+# Opt-in logging configuration for applications
+def configure_logging(level=logging.WARNING):
     """
-    Abstract base class representing a generic tire.
+    Configure root logging for applications that want to see tire logs.
+    """
+    logging.basicConfig(level=level, format='%(asctime)s - %(levelname)s - %(message)s')
+
+
+# Decorator for logging method calls
+def logged(method):
+    """
+    Decorator to log method calls and their results.
+
+    Returns the method unchanged when TRACE_ENABLED is False, and only
+    formats messages when the logger is enabled for INFO.
     """
+    if not TRACE_ENABLED:
+        return method
+
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Calling %s with %s and %s", method.__name__, args, kwargs)
+        try:
+            result = method(*args, **kwargs)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("%s returned %s", method.__name__, result)
+            return result
+        except Exception as e:
+            logger.error("Error in %s: %s", method.__name__, e)
+            raise
+
+    return wrapper
+
+
+# Metaclass that traces the methods a class names in _TRACE
+class TracedMeta(type):
+    """
+    Metaclass that wraps the methods listed in a class's _TRACE tuple with
+    logged, only when tracing is enabled. Inherited methods are skipped, as
+    the class that defines them already wrapped them.
+    """
+
+    def __new__(mcls, name, bases, namespace, **kwargs):
+        if TRACE_ENABLED:
+            for attr in namespace.get('_TRACE', ()):
+                if attr in namespace:
+                    namespace[attr] = logged(namespace[attr])
+        return super().__new__(mcls, name, bases, namespace, **kwargs)
+
+
+# Base Class
+class Tire(metaclass=TracedMeta):
+    """
+    Base class representing a generic tire.
+
+    Subclasses must implement circumference and surface_area; this is
+    checked once, when the subclass is defined.
+    """
+
+    __slots__ = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        for name in ('circumference', 'surface_area'):
+            if getattr(cls, name) is getattr(Tire, name):
+                raise TypeError(f"{cls.__name__} must implement {name}")
 
-    @abstractmethod
     def circumference(self):
         """
         Calculate the circumference of the tire.
         """
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def surface_area(self):
         """
         Calculate the surface area of the tire.
         """
-        pass
+        raise NotImplementedError
 
 
 # Mixin for logging
@@ -34,9 +109,11 @@ class LogMixin:
     Mixin for logging messages.
     """
 
+    __slots__ = ()
+
     @staticmethod
     def log(message):
-        logging.info(message)
+        logger.info(message)
 
 
 # Mixin for serialization
@@ -45,112 +122,135 @@ class SerializationMixin:
     Mixin for serializing objects to JSON.
     """
 
+    __slots__ = ()
+    _FIELDS = ()
+
+    def _asdict(self):
+        return {key: getattr(self, key) for key in self._FIELDS}
+
     def serialize(self):
         """
-        Serialize the object to a JSON string.
+        Serialize the attributes named in _FIELDS to a JSON string.
         """
-        return json.dumps(self.__dict__)
+        return _ENCODER.encode(self._asdict())
 
 
-# Decorator for logging method calls
-def logged(method):
+# Mixin for serialization of immutable objects
+class CachedSerializationMixin(SerializationMixin):
     """
-    Decorator to log method calls and their results.
+    Mixin for serializing immutable objects to JSON, encoding them only once.
+    Only use it for classes whose _FIELDS cannot change after construction.
     """
 
-    def wrapper(*args, **kwargs):
-        logging.info(f"Calling {method.__name__} with {args} and {kwargs}")
-        try:
-            result = method(*args, **kwargs)
-            logging.info(f"{method.__name__} returned {result}")
-            return result
-        except Exception as e:
-            logging.error(f"Error in {method.__name__}: {e}")
-            raise
+    __slots__ = ('_json',)
 
-    return wrapper
+    def serialize(self):
+        """
+        Serialize the object to a JSON string, reusing the first result.
+        """
+        try:
+            return self._json
+        except AttributeError:
+            self._json = super().serialize()
+            return self._json
+
+
+# Validation shared by the tire constructors
+def _check_positive(radius, width=None):
+    if radius <= 0:
+        raise ValueError("Radius must be positive")
+    if width is not None and width <= 0:
+        raise ValueError("Width must be positive")
+
+
+# Classes built by specialize(), keyed on the base class and float dimensions
+_SPECIALIZED = weakref.WeakValueDictionary()
+
+
+def _specialize(cls, *dimensions):
+    if cls._DIMENSIONS is not None:
+        raise TypeError(f"{cls.__name__} is already specialized")
+    dimensions = tuple(map(float, dimensions))
+    key = (cls, dimensions)
+    specialized = _SPECIALIZED.get(key)
+    if specialized is None:
+        name = f"{cls.__name__}({', '.join(map(repr, dimensions))})"
+        specialized = type(cls)(name, (cls,), {
+            '__module__': cls.__module__,
+            '__slots__': (),
+            '__init__': cls(*dimensions)._fixed_init(),
+            '_DIMENSIONS': dimensions,
+        })
+        _SPECIALIZED[key] = specialized
+    return specialized
 
 
-# Concrete class for Car Tire
-class CarTire(Tire, LogMixin, SerializationMixin):
+# Concrete class for Bicycle Tire
+class BicycleTire(Tire, LogMixin, SerializationMixin):
     """
-    Represents a car tire with a radius and width.
+    Represents a bicycle tire with a radius.
     """
 
-    def __init__(self, radius, width):
-        self._radius = radius
-        self._width = width
+    _FIELDS = ('_radius', 'pressure')
+    __slots__ = _FIELDS + ('_circumference', '_surface_area')
+    _TRACE = ('circumference', 'surface_area', 'inflate', 'deflate')
+    _DIMENSIONS = None
 
-    @logged
-    def circumference(self):
-        """
-        Calculate the circumference of the car tire.
-        """
-        return 2 * math.pi * self._radius
+    def __init__(self, radius):
+        _check_positive(radius)
+        self._assign(radius)
 
-    @logged
-    def surface_area(self):
+    @classmethod
+    def from_trusted(cls, radius):
         """
-        Calculate the surface area of the car tire.
+        Create a bicycle tire from a radius that is already validated.
         """
-        return 2 * math.pi * self._radius * self._width
+        tire = cls.__new__(cls)
+        tire._assign(radius)
+        return tire
+
+    def _assign(self, radius):
+        self._radius = radius
+        self.pressure = 0
+        self._circumference = _TAU * radius
+        self._surface_area = _PI * radius ** 2
 
     @property
     def radius(self):
         return self._radius
 
-    @radius.setter
-    def radius(self, value):
-        if value <= 0:
-            raise ValueError("Radius must be positive")
-        self._radius = value
-
-    @property
-    def width(self):
-        return self._width
+    @classmethod
+    def specialize(cls, radius):
+        """
+        Return a subclass with the radius fixed. The radius is validated and
+        the geometry computed once, here, so instantiating the subclass takes
+        no arguments and only sets the precomputed fields.
+        """
+        return _specialize(cls, radius)
 
-    @width.setter
-    def width(self, value):
-        if value <= 0:
-            raise ValueError("Width must be positive")
-        self._width = value
+    def _fixed_init(self):
+        radius, circumference, surface_area = self._radius, self._circumference, self._surface_area
 
+        def __init__(self):
+            self._radius = radius
+            self.pressure = 0
+            self._circumference = circumference
+            self._surface_area = surface_area
 
-# Concrete class for Bicycle Tire
-class BicycleTire(Tire, LogMixin, SerializationMixin):
-    """
-    Represents a bicycle tire with a radius.
-    """
+        return __init__
 
-    def __init__(self, radius):
-        self._radius = radius
-        self.pressure = 0
-
-    @logged
     def circumference(self):
         """
-        Calculate the circumference of the bicycle tire.
+        Return the circumference of the bicycle tire, computed at construction.
         """
-        return 2 * math.pi * self._radius
+        return self._circumference
 
-    @logged
     def surface_area(self):
         """
-        Calculate the surface area of the bicycle tire.
+        Return the surface area of the bicycle tire, computed at construction.
         """
-        return math.pi * self._radius ** 2
-
-    @property
-    def radius(self):
-        return self._radius
+        return self._surface_area
 
-    @radius.setter
-    def radius(self, value):
-        if value <= 0:
-            raise ValueError("Radius must be positive")
-        self._radius = value
-
-    @logged
     def inflate(self, pressure):
         """
         Inflate the bicycle tire to the specified pressure.
@@ -160,7 +260,6 @@ class BicycleTire(Tire, LogMixin, SerializationMixin):
         self.pressure = pressure
         return f"Inflated to {pressure} PSI"
 
-    @logged
     def deflate(self):
         """
         Deflate the bicycle tire.
@@ -169,217 +268,184 @@ class BicycleTire(Tire, LogMixin, SerializationMixin):
         return "Deflated"
 
 
-# Concrete class for Motorcycle Tire
-class MotorcycleTire(Tire, LogMixin, SerializationMixin):
+# Actions performed by each kind of tire that has a radius and width
+_ACTIONS = {
+    'car': None,
+    'motorcycle': "Burnout performed",
+    'truck': "Retread performed",
+    'racing': "Heated",
+    'offroad': "Mud applied",
+}
+
+
+# Concrete class for tires with a radius and width
+class WidthTire(Tire, LogMixin, CachedSerializationMixin):
     """
-    Represents a motorcycle tire with a radius and width.
+    Represents a car, motorcycle, truck, racing or off-road tire with a
+    radius and width. All state is set once at construction in private
+    slots and exposed read-only, so instances are immutable, hashable and
+    compare by value.
     """
 
-    def __init__(self, radius, width):
-        self._radius = radius
-        self._width = width
+    _FIELDS = ('_radius', '_width', '_kind')
+    __slots__ = _FIELDS + ('_circumference', '_surface_area', '_action')
+    _TRACE = ('circumference', 'surface_area', 'action')
+    _DIMENSIONS = None
 
-    @logged
-    def circumference(self):
-        """
-        Calculate the circumference of the motorcycle tire.
-        """
-        return 2 * math.pi * self._radius
+    def __init__(self, radius, width, kind='car'):
+        if kind not in _ACTIONS:
+            raise ValueError(f"Unknown tire kind: {kind}")
+        _check_positive(radius, width)
+        self._assign(radius, width, kind)
 
-    @logged
-    def surface_area(self):
+    @classmethod
+    def from_trusted(cls, radius, width, kind='car'):
         """
-        Calculate the surface area of the motorcycle tire.
+        Create a tire from a radius, width and kind that are already validated.
         """
-        return 2 * math.pi * self._radius * self._width
-
-    @property
-    def radius(self):
-        return self._radius
+        tire = cls.__new__(cls)
+        tire._assign(radius, width, kind)
+        return tire
 
-    @radius.setter
-    def radius(self, value):
-        if value <= 0:
-            raise ValueError("Radius must be positive")
-        self._radius = value
-
-    @property
-    def width(self):
-        return self._width
-
-    @width.setter
-    def width(self, value):
-        if value <= 0:
-            raise ValueError("Width must be positive")
-        self._width = value
+    def _assign(self, radius, width, kind):
+        self._radius = radius
+        self._width = width
+        self._kind = kind
+        self._circumference = _TAU * radius
+        self._surface_area = _TAU * radius * width
+        self._action = _ACTIONS[kind]
 
-    @logged
-    def burnout(self):
+    @classmethod
+    def specialize(cls, radius, width):
         """
-        Perform a burnout.
+        Return a subclass with the radius and width fixed. The dimensions are
+        validated and the geometry computed once, here, so instantiating the
+        subclass only takes the kind.
         """
-        return "Burnout performed"
+        return _specialize(cls, radius, width)
 
+    def _fixed_init(self):
+        radius, width = self._radius, self._width
+        circumference, surface_area = self._circumference, self._surface_area
 
-# Concrete class for Truck Tire
-class TruckTire(Tire, LogMixin, SerializationMixin):
-    """
-    Represents a truck tire with a radius and width.
-    """
+        def __init__(self, kind='car'):
+            if kind not in _ACTIONS:
+                raise ValueError(f"Unknown tire kind: {kind}")
+            self._radius = radius
+            self._width = width
+            self._kind = kind
+            self._circumference = circumference
+            self._surface_area = surface_area
+            self._action = _ACTIONS[kind]
 
-    def __init__(self, radius, width):
-        self._radius = radius
-        self._width = width
+        return __init__
 
-    @logged
-    def circumference(self):
-        """
-        Calculate the circumference of the truck tire.
-        """
-        return 2 * math.pi * self._radius
+    def __eq__(self, other):
+        if not isinstance(other, WidthTire):
+            return NotImplemented
+        return (self._radius, self._width, self._kind) == (other._radius, other._width, other._kind)
 
-    @logged
-    def surface_area(self):
-        """
-        Calculate the surface area of the truck tire.
-        """
-        return 2 * math.pi * self._radius * self._width
+    def __hash__(self):
+        return hash((self._radius, self._width, self._kind))
 
     @property
     def radius(self):
         return self._radius
 
-    @radius.setter
-    def radius(self, value):
-        if value <= 0:
-            raise ValueError("Radius must be positive")
-        self._radius = value
-
     @property
     def width(self):
         return self._width
 
-    @width.setter
-    def width(self, value):
-        if value <= 0:
-            raise ValueError("Width must be positive")
-        self._width = value
-
-    @logged
-    def retread(self):
-        """
-        Retread the truck tire.
-        """
-        return "Retread performed"
-
-
-# Concrete class for Racing Tire
-class RacingTire(Tire, LogMixin, SerializationMixin):
-    """
-    Represents a racing tire with a radius and width.
-    """
-
-    def __init__(self, radius, width):
-        self._radius = radius
-        self._width = width
+    @property
+    def kind(self):
+        return self._kind
 
-    @logged
     def circumference(self):
         """
-        Calculate the circumference of the racing tire.
+        Return the circumference of the tire, computed at construction.
         """
-        return 2 * math.pi * self._radius
+        return self._circumference
 
-    @logged
     def surface_area(self):
         """
-        Calculate the surface area of the racing tire.
+        Return the surface area of the tire, computed at construction.
         """
-        return 2 * math.pi * self._radius * self._width
+        return self._surface_area
 
-    @property
-    def radius(self):
-        return self._radius
+    def action(self):
+        """
+        Perform the action specific to this kind of tire.
+        """
+        if self._action is None:
+            raise ValueError(f"No action for {self._kind} tires")
+        return self._action
 
-    @radius.setter
-    def radius(self, value):
-        if value <= 0:
-            raise ValueError("Radius must be positive")
-        self._radius = value
 
-    @property
-    def width(self):
-        return self._width
+def make_tire(kind, radius, width):
+    """
+    Create a tire of the given kind with a radius and width.
+    """
+    return WidthTire(radius, width, kind)
 
-    @width.setter
-    def width(self, value):
-        if value <= 0:
-            raise ValueError("Width must be positive")
-        self._width = value
 
-    @logged
-    def heat(self):
-        """
-        Heat the racing tire.
-        """
-        return "Heated"
+def serialize_many(tires):
+    """
+    Serialize a collection of tires to a single JSON array in one encoder pass.
+    """
+    return _ENCODER.encode([tire._asdict() for tire in tires])
 
 
-# Concrete class for Off-road Tire
-class OffroadTire(Tire, LogMixin, SerializationMixin):
+# Struct-of-arrays batch of tires with a radius and width
+@dataclass
+class TireBatch:
     """
-    Represents an off-road tire with a radius and width.
+    Stores many tires as compact radius and width columns and serializes
+    them as one JSON object of columns.
     """
 
-    def __init__(self, radius, width):
-        self._radius = radius
-        self._width = width
+    radii: array = field(default_factory=lambda: array('d'))
+    widths: array = field(default_factory=lambda: array('d'))
 
-    @logged
-    def circumference(self):
-        """
-        Calculate the circumference of the off-road tire.
-        """
-        return 2 * math.pi * self._radius
+    def __post_init__(self):
+        self.radii = array('d', self.radii)
+        self.widths = array('d', self.widths)
+        if len(self.radii) != len(self.widths):
+            raise ValueError("Radii and widths must have the same length")
+        if self.radii and min(self.radii) <= 0:
+            raise ValueError("Radius must be positive")
+        if self.widths and min(self.widths) <= 0:
+            raise ValueError("Width must be positive")
 
-    @logged
-    def surface_area(self):
+    @classmethod
+    def from_tires(cls, tires):
         """
-        Calculate the surface area of the off-road tire.
+        Build a batch from tire objects that have a radius and width.
         """
-        return 2 * math.pi * self._radius * self._width
+        return cls([t.radius for t in tires], [t.width for t in tires])
 
-    @property
-    def radius(self):
-        return self._radius
-
-    @radius.setter
-    def radius(self, value):
-        if value <= 0:
-            raise ValueError("Radius must be positive")
-        self._radius = value
+    def __len__(self):
+        return len(self.radii)
 
-    @property
-    def width(self):
-        return self._width
-
-    @width.setter
-    def width(self, value):
-        if value <= 0:
-            raise ValueError("Width must be positive")
-        self._width = value
+    def append(self, radius, width):
+        """
+        Add a tire to the batch.
+        """
+        _check_positive(radius, width)
+        self.radii.append(radius)
+        self.widths.append(width)
 
-    @logged
-    def mud(self):
+    def serialize(self):
         """
-        Apply mud to the off-road tire.
+        Serialize the whole batch to a single JSON string of columns.
         """
-        return "Mud applied"
+        return _ENCODER.encode({'radii': self.radii.tolist(), 'widths': self.widths.tolist()})
 
 
 # Example usage
 if __name__ == "__main__":
-    car_tire = CarTire(0.35, 0.2)
+    configure_logging(logging.INFO)
+
+    car_tire = make_tire('car', 0.35, 0.2)
     print(f"Car Tire circumference: {car_tire.circumference()} meters")
     print(f"Car Tire surface area: {car_tire.surface_area()} square meters")
     print(car_tire.serialize())
@@ -390,26 +456,37 @@ if __name__ == "__main__":
     print(bicycle_tire.inflate(40))
     print(bicycle_tire.serialize())
 
-    motorcycle_tire = MotorcycleTire(0.35, 0.2)
+    motorcycle_tire = make_tire('motorcycle', 0.35, 0.2)
     print(f"Motorcycle Tire circumference: {motorcycle_tire.circumference()} meters")
     print(f"Motorcycle Tire surface area: {motorcycle_tire.surface_area()} square meters")
-    print(motorcycle_tire.burnout())
+    print(motorcycle_tire.action())
     print(motorcycle_tire.serialize())
 
-    truck_tire = TruckTire(0.35, 0.2)
+    truck_tire = make_tire('truck', 0.35, 0.2)
     print(f"Truck Tire circumference: {truck_tire.circumference()} meters")
     print(f"Truck Tire surface area: {truck_tire.surface_area()} square meters")
-    print(truck_tire.retread())
+    print(truck_tire.action())
     print(truck_tire.serialize())
 
-    racing_tire = RacingTire(0.35, 0.2)
+    racing_tire = make_tire('racing', 0.35, 0.2)
     print(f"Racing Tire circumference: {racing_tire.circumference()} meters")
     print(f"Racing Tire surface area: {racing_tire.surface_area()} square meters")
-    print(racing_tire.heat())
+    print(racing_tire.action())
     print(racing_tire.serialize())
 
-    offroad_tire = OffroadTire(0.35, 0.2)
+    offroad_tire = make_tire('offroad', 0.35, 0.2)
     print(f"Off-road Tire circumference: {offroad_tire.circumference()} meters")
     print(f"Off-road Tire surface area: {offroad_tire.surface_area()} square meters")
-    print(offroad_tire.mud())
+    print(offroad_tire.action())
     print(offroad_tire.serialize())
+
+    sku = WidthTire.specialize(0.35, 0.2)
+    sku_tire = sku('truck')
+    print(f"SKU Tire circumference: {sku_tire.circumference()} meters")
+    print(f"SKU Tire surface area: {sku_tire.surface_area()} square meters")
+    print(sku_tire.serialize())
+
+    print(serialize_many([car_tire, bicycle_tire, truck_tire]))
+
+    batch = TireBatch.from_tires([car_tire, motorcycle_tire, truck_tire, racing_tire, offroad_tire])
+    print(batch.serialize())